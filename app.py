@@ -1,5 +1,17 @@
 import streamlit as st
 
+# Page shell first: Streamlit sends these to the browser while the project
+# modules below are still being imported.
+st.set_page_config(page_title="Sweden vs EU Economic Dashboard", layout="wide")
+st.title("📊 Sweden vs EU Economic Dashboard")
+st.markdown(
+    "A macroeconomic dashboard comparing **Sweden** and the **EU**, "
+    "with data pulled directly from [Eurostat](https://ec.europa.eu/eurostat). "
+    "Use the tabs below to explore country-specific data or compare across regions."
+)
+
+# Project modules are imported after the shell; eurostat is deferred further, to the fetch
+# path in utils/eurostat_loader.py. Profile cold-start cost with: python -m utils.import_profile
 from modules.charts import (
     big_numbers_block,
     inflation_chart,
@@ -14,46 +26,49 @@ from modules.charts import (
     debt_to_gdp_chart,
     comparison_section,
 )
+from modules.export import export_section
 
 from utils.eurostat_loader import (
     load_inflation,
     load_inflation_yoy,
     load_interest_rates,
-    load_interest_rates_detail,
     load_unemployment,
     load_unemployment_detail,
     load_population,
     load_gdp,
     load_gdp_per_capita,
     load_debt_to_gdp,
+    load_aligned,
+    data_version,
+    ALL_GEOS,
     prefetch_all,
 )
 
-st.set_page_config(page_title="Sweden vs EU Economic Dashboard", layout="wide")
-st.title("📊 Sweden vs EU Economic Dashboard")
-st.markdown(
-    "A macroeconomic dashboard comparing **Sweden** and the **EU**, "
-    "with data pulled directly from [Eurostat](https://ec.europa.eu/eurostat). "
-    "Use the tabs below to explore country-specific data or compare across regions."
-)
-
 # Fetch all datasets in parallel → saved to local .data_cache/ as parquet
 with st.spinner("Loading data from Eurostat (first time only)..."):
     prefetch_all()
 
-# Load data (reads from local parquet cache — instant)
-inflation = load_inflation()
-inflation_yoy = load_inflation_yoy()
-interest = load_interest_rates()
-unemp = load_unemployment()
-population = load_population()
-gdp = load_gdp()
-gdp_pc = load_gdp_per_capita()
-debt = load_debt_to_gdp()
+# Drops loader caches built from older parquet files before anything reads them
+version = data_version()
+
+# Load data (reads from local parquet cache — instant). Every EU member is loaded so the
+# comparison selector can offer all of them; the country tabs pick their own column.
+inflation = load_inflation(geo_list=ALL_GEOS)
+inflation_yoy = load_inflation_yoy(geo_list=ALL_GEOS)
+interest = load_interest_rates(geo_list=ALL_GEOS)
+unemp = load_unemployment(geo_list=ALL_GEOS)
+population = load_population(geo_list=ALL_GEOS)
+gdp = load_gdp(geo_list=ALL_GEOS)
+gdp_pc = load_gdp_per_capita(geo_list=ALL_GEOS)
+debt = load_debt_to_gdp(geo_list=ALL_GEOS)
 unemp_detail_se = load_unemployment_detail(geo="SE")
-interest_detail_se = load_interest_rates_detail(geo="SE")
 
-tab1, tab2, tab3 = st.tabs(["🇸🇪 Sweden", "🇪🇺 Europe", "📊 Comparison"])
+# Pre-aligned, pre-windowed views (built once per data version, shared across sessions)
+gdp_pc_15y = load_aligned("gdp_per_capita", "A", years=15)
+interest_yearly_5y = load_aligned("interest_rates", "A", "mean", years=5)
+interest_detail_se_5y = load_aligned("interest_rates_detail", "M", years=5)
+
+tab1, tab2, tab3, tab4 = st.tabs(["🇸🇪 Sweden", "🇪🇺 Europe", "📊 Comparison", "⬇️ Export"])
 
 with tab1:
     st.markdown(
@@ -69,15 +84,15 @@ with tab1:
     st.divider()
     interest_chart(interest, "SE", key_prefix="tab_se")
     st.divider()
-    interest_rate_bar_chart(interest, "SE", years=5, key_prefix="tab_se")
+    interest_rate_bar_chart(interest_yearly_5y, "SE", key_prefix="tab_se")
     st.divider()
-    interest_detail_chart(interest_detail_se, years=5, key_prefix="tab_se")
+    interest_detail_chart(interest_detail_se_5y, key_prefix="tab_se")
     st.divider()
     unemployment_chart(unemp, "SE", key_prefix="tab_se")
     st.divider()
     unemployment_detail_chart(unemp_detail_se, key_prefix="tab_se")
     st.divider()
-    gdp_per_capita_chart(gdp_pc, "SE", years=15, key_prefix="tab_se")
+    gdp_per_capita_chart(gdp_pc_15y, "SE", key_prefix="tab_se")
     st.divider()
     debt_to_gdp_chart(debt, geo="SE", key_prefix="tab_se")
 
@@ -95,20 +110,26 @@ with tab2:
     st.divider()
     interest_chart(interest, "EU", key_prefix="tab_eu")
     st.divider()
-    interest_rate_bar_chart(interest, "EU", years=5, key_prefix="tab_eu")
+    interest_rate_bar_chart(interest_yearly_5y, "EU", key_prefix="tab_eu")
     st.divider()
     unemployment_chart(unemp, "EU", key_prefix="tab_eu")
     st.divider()
-    gdp_per_capita_chart(gdp_pc, "EU", years=15, key_prefix="tab_eu")
+    gdp_per_capita_chart(gdp_pc_15y, "EU", key_prefix="tab_eu")
     st.divider()
     debt_to_gdp_chart(debt, geo="EU", key_prefix="tab_eu")
 
 with tab3:
     st.markdown(
         "Side-by-side comparison of **Sweden, EU, Denmark, Finland, and Norway** across all indicators. "
-        "Use the country selector below to choose which regions to include. "
+        "Use the country selector below to choose which regions to include, or add any other EU member state. "
         "Note: Norway is missing from interest rates and government debt (not an EU member, data not in Eurostat)."
     )
-    comparison_section(inflation, interest, unemp, population, gdp_pc, debt, inflation_yoy, key_prefix="tab_cmp")
+    comparison_section(
+        inflation, interest, unemp, population, gdp_pc, debt, inflation_yoy,
+        key_prefix="tab_cmp", version=version,
+    )
     st.divider()
     gdp_pc_comparison_bar(gdp_pc, key_prefix="tab_cmp")
+
+with tab4:
+    export_section(key_prefix="tab_export")
@@ -0,0 +1,193 @@
+"""Micro-benchmarks for every public loader in utils/eurostat_loader.py.
+
+    python bench.py --json bench_main.json                       # on main
+    python bench.py --compare bench_main.json --max-ratio 1.25   # on a branch
+
+Each loader runs against synthetic fixtures (utils/fixtures.py) at two input sizes,
+with a cold cache (st.cache_data cleared, parquet re-read) and a warm cache.
+Wall time is the median of --repeat runs; allocations are the tracemalloc peak of
+one extra run, so tracing overhead does not leak into the timings.
+
+The "comparison" group times what a multiselect click in the Comparison tab costs:
+cached per-geo trace preparation, then _comparison_chart end to end (figure assembly
+plus the plotly serialization st.plotly_chart does) for 5 regions up to every EU
+country. The run fails if the all-regions click costs more than --max-cmp-ratio
+times the 5-region one, i.e. if a click stops staying flat as the list grows.
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from utils.fixtures import write_fixtures
+
+# name -> fixture scale passed to write_fixtures
+SIZES = {
+    "small": {},
+    "large": {"n_geos": 60, "n_years": 60, "extra_dims": 2},
+}
+
+
+def _loader_calls():
+    import utils.eurostat_loader as loader
+
+    calls = dict(loader.PANEL_LOADERS)
+    for name, fn in loader.DETAIL_LOADERS.items():
+        calls[name] = lambda fn=fn: fn(geo="SE")
+    return calls
+
+
+def _measure(fn, prepare, repeat):
+    times = []
+    for _ in range(repeat):
+        prepare()
+        t0 = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t0) * 1000)
+
+    prepare()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "peak_alloc_kb": peak / 1024,
+    }
+
+
+def run(sizes, repeat, only=None):
+    import streamlit as st
+    import utils.eurostat_loader as loader
+
+    calls = {name: fn for name, fn in _loader_calls().items() if not only or name in only}
+    if not calls:
+        return {}  # e.g. --only comparison: no fixtures to write
+
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix=f"eurostat_bench_{size}_") as cache_dir:
+            write_fixtures(cache_dir, **SIZES[size])
+            loader._CACHE_DIR = Path(cache_dir)
+
+            for name, fn in calls.items():
+                cold = _measure(fn, st.cache_data.clear, repeat)
+                fn()  # make sure the cache is populated
+                warm = _measure(fn, lambda: None, repeat)
+                results[f"{name}/{size}/cold"] = cold
+                results[f"{name}/{size}/warm"] = warm
+                print(
+                    f"{name:>24} {size:>5}  cold {cold['median_ms']:9.2f} ms {cold['peak_alloc_kb']:10.0f} KB"
+                    f"  warm {warm['median_ms']:9.3f} ms {warm['peak_alloc_kb']:10.0f} KB"
+                )
+    return results
+
+
+def run_comparison(repeat):
+    import streamlit as st
+    import utils.eurostat_loader as loader
+    from modules.charts import _comparison_chart, _frame_id, _geo_traces
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="eurostat_bench_cmp_") as cache_dir:
+        write_fixtures(cache_dir, n_geos=35)  # Nordics + aggregates + every other EU member
+        loader._CACHE_DIR = Path(cache_dir)
+        st.cache_data.clear()
+
+        geos = tuple(pd.read_parquet(Path(cache_dir) / "prc_hicp_midx.parquet")["geo\\TIME_PERIOD"].unique())
+        panel = loader.load_inflation(geo_list=geos)
+
+        frame_id = _frame_id(panel)
+        prep = _measure(lambda: _geo_traces(panel, "bench", "v", frame_id), _geo_traces.clear, repeat)
+        results["comparison/traces/cold"] = prep
+        print(f"{'comparison traces':>24} {len(panel.columns):>3} geos  cold {prep['median_ms']:9.2f} ms")
+
+        # A click with a new selection: warm traces, a fresh figure (the session memo is
+        # dropped) and st.plotly_chart's plotly.io.to_json serialization
+        cols = list(_geo_traces(panel, "bench", "v", frame_id))
+
+        def _click(n):
+            _comparison_chart(panel, "bench", "bench", "y", cols[:n], {}, "bench", "v")
+
+        def _new_selection():
+            st.session_state.pop("_fig_bench", None)
+
+        _new_selection()
+        _click(1)  # keep the plotly import out of the timings
+        for n in sorted({5, len(cols) // 2, len(cols)}):
+            click = _measure(lambda: _click(n), _new_selection, repeat)
+            results[f"comparison/click/{n}geos"] = click
+            print(f"{'comparison click':>24} {n:>3} geos       {click['median_ms']:9.2f} ms {click['peak_alloc_kb']:10.0f} KB")
+    return results
+
+
+def comparison_ratio(results):
+    """Median click time for the most regions benchmarked vs 5 regions."""
+    clicks = {int(k.split("/")[2][:-4]): v["median_ms"] for k, v in results.items() if k.startswith("comparison/click/")}
+    if 5 not in clicks or not clicks[5]:
+        return None
+    return clicks[max(clicks)] / clicks[5]
+
+
+def compare(results, baseline, max_ratio=None):
+    """Print time/allocation ratios vs a baseline; return the entries over max_ratio."""
+    regressions = []
+    print(f"\n{'benchmark':>36} {'time':>8} {'alloc':>8}")
+    for key, cur in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        t_ratio = cur["median_ms"] / base["median_ms"] if base["median_ms"] else float("inf")
+        a_ratio = cur["peak_alloc_kb"] / base["peak_alloc_kb"] if base["peak_alloc_kb"] else float("inf")
+        flag = ""
+        if max_ratio is not None and t_ratio > max_ratio:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:>36} {t_ratio:7.2f}x {a_ratio:7.2f}x{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Eurostat loaders on synthetic data.")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="loader names (see PANEL_LOADERS / DETAIL_LOADERS) or 'comparison'")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results file from another branch")
+    parser.add_argument("--max-ratio", type=float, help="fail if median time exceeds baseline by this factor")
+    parser.add_argument("--max-cmp-ratio", type=float, default=3.0,
+                        help="fail if an all-regions comparison click exceeds a 5-region one by this factor")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, only=args.only)
+    if not args.only or "comparison" in args.only:
+        results.update(run_comparison(args.repeat))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+    failed = False
+    ratio = comparison_ratio(results)
+    if ratio is not None:
+        print(f"\ncomparison click, all regions vs 5: {ratio:.2f}x (max {args.max_cmp_ratio:.2f}x)")
+        if ratio > args.max_cmp_ratio:
+            print("FAIL: comparison click cost grows with the number of regions")
+            failed = True
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if compare(results, baseline, args.max_ratio):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""Multi-session load test for app.py on synthetic Eurostat data.
+
+    python loadtest.py --sessions 50 --interactions 5 --max-p95-ms 2000 --min-hit-rate 0.9
+
+Sessions are driven with Streamlit's AppTest. AppTest swaps a process-global mock
+runtime on every run, so sessions cannot share threads safely; instead they are
+spread over worker processes and run one after another inside each worker,
+round-robin against that process's st.cache_data caches.
+
+This means at most --workers reruns ever overlap: concurrency equals the worker
+count, not the session count. Caches are per worker too, so the hit rate is that
+of --workers independent servers, each serving sessions/workers sessions.
+
+AppTest cannot exercise fragment-only reruns: `at.run()` always reruns the whole
+script, so "interaction" latency is a full rerun, not the st.fragment path the
+Comparison tab takes in a browser. bench.py's comparison group times that path.
+
+Exits with status 1 if any threshold is violated.
+"""
+import argparse
+import functools
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import get_context
+from pathlib import Path
+
+APP_PATH = str(Path(__file__).resolve().parent / "app.py")
+CMP_SELECT_KEY = "tab_cmp_cmp_select"
+
+
+def _instrument_loaders(calls, misses):
+    """Count calls to every public loader (hits + misses) and executions of its body (misses).
+
+    Each loader is rebuilt as st.cache_data around its undecorated body
+    (`__wrapped__`) plus a miss counter, then wrapped again to count calls. Nested
+    loader calls go through the module globals, so they are counted as well.
+    """
+    import streamlit as st
+    import utils.eurostat_loader as loader
+
+    lock = threading.Lock()
+
+    def _bump(counter, name):
+        with lock:
+            counter[name] = counter.get(name, 0) + 1
+
+    for registry in (loader.PANEL_LOADERS, loader.DETAIL_LOADERS):
+        for key, cached in registry.items():
+            name = cached.__name__
+
+            @functools.wraps(cached.__wrapped__)
+            def body(*args, _body=cached.__wrapped__, _name=name, **kwargs):
+                _bump(misses, _name)
+                return _body(*args, **kwargs)
+
+            recached = st.cache_data(ttl="6h")(body)
+
+            def counted(*args, _cached=recached, _name=name, **kwargs):
+                _bump(calls, _name)
+                return _cached(*args, **kwargs)
+
+            counted.clear = recached.clear  # data_version() clears loaders through the registries
+            registry[key] = counted
+            setattr(loader, name, counted)
+
+
+def _run_worker(args):
+    """Run a share of the sessions in this process; return raw measurements."""
+    worker_id, n_sessions, n_interactions, timeout, seed = args
+    sys.path.insert(0, str(Path(APP_PATH).parent))
+
+    from streamlit.testing.v1 import AppTest
+
+    calls, misses = {}, {}
+    _instrument_loaders(calls, misses)
+    rng = random.Random(seed + worker_id)
+
+    result = {"initial_ms": [], "interaction_ms": [], "errors": []}
+
+    def _timed_run(at, kind):
+        t0 = time.perf_counter()
+        at.run(timeout=timeout)
+        result[f"{kind}_ms"].append((time.perf_counter() - t0) * 1000)
+        if at.exception:
+            result["errors"].append(str(at.exception[0].message))
+
+    sessions = [AppTest.from_file(APP_PATH, default_timeout=timeout) for _ in range(n_sessions)]
+    for at in sessions:
+        _timed_run(at, "initial")
+
+    for _ in range(n_interactions):
+        for at in sessions:
+            select = at.multiselect(key=CMP_SELECT_KEY)
+            options = list(select.options)
+            select.set_value(rng.sample(options, rng.randint(1, len(options))))
+            _timed_run(at, "interaction")
+
+    result["calls"] = sum(calls.values())
+    result["misses"] = sum(misses.values())
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+    return result
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def summarize(results):
+    latencies = [v for r in results for v in r["initial_ms"] + r["interaction_ms"]]
+    calls = sum(r["calls"] for r in results)
+    misses = sum(r["misses"] for r in results)
+    summary = {
+        "reruns": len(latencies),
+        "errors": sum(len(r["errors"]) for r in results),
+        "peak_rss_mb": max(r["peak_rss_mb"] for r in results),
+        "cache_hit_rate": 1 - misses / calls if calls else None,
+    }
+    for kind in ("initial", "interaction"):
+        values = [v for r in results for v in r[f"{kind}_ms"]]
+        for q in (50, 95, 99):
+            summary[f"{kind}_p{q}_ms"] = _percentile(values, q)
+    for q in (50, 95, 99):
+        summary[f"p{q}_ms"] = _percentile(latencies, q)
+    return summary
+
+
+def check_thresholds(summary, args):
+    failures = []
+    for q in (50, 95, 99):
+        limit = getattr(args, f"max_p{q}_ms")
+        value = summary[f"p{q}_ms"]
+        if limit is None:
+            continue
+        if value is None:
+            failures.append(f"p{q} rerun latency: no reruns measured")
+        elif value > limit:
+            failures.append(f"p{q} rerun latency {value:.0f} ms > {limit:.0f} ms")
+    if args.max_peak_mb is not None and summary["peak_rss_mb"] > args.max_peak_mb:
+        failures.append(f"peak RSS {summary['peak_rss_mb']:.0f} MB > {args.max_peak_mb:.0f} MB")
+    if args.min_hit_rate is not None:
+        hit_rate = summary["cache_hit_rate"]
+        if hit_rate is None:
+            failures.append("cache hit rate: no loader calls measured")
+        elif hit_rate < args.min_hit_rate:
+            failures.append(f"cache hit rate {hit_rate:.2%} < {args.min_hit_rate:.2%}")
+    if summary["errors"] > args.max_errors:
+        failures.append(f"{summary['errors']} script errors > {args.max_errors}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test app.py with many sessions on synthetic data.")
+    parser.add_argument("--sessions", type=int, default=50, help="total simulated sessions")
+    parser.add_argument("--interactions", type=int, default=5, help="multiselect changes per session")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="worker processes; also the number of reruns that overlap")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds per rerun before AppTest gives up")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-p50-ms", type=float)
+    parser.add_argument("--max-p95-ms", type=float)
+    parser.add_argument("--max-p99-ms", type=float)
+    parser.add_argument("--max-peak-mb", type=float)
+    parser.add_argument("--min-hit-rate", type=float)
+    parser.add_argument("--max-errors", type=int, default=0)
+    parser.add_argument("--json", help="write the summary to this file")
+    args = parser.parse_args(argv)
+
+    from utils.fixtures import write_fixtures
+
+    with tempfile.TemporaryDirectory(prefix="eurostat_fixtures_") as cache_dir:
+        write_fixtures(cache_dir, seed=args.seed, n_geos=35)  # all EU members, as app.py loads them
+        os.environ["EUROSTAT_CACHE_DIR"] = cache_dir  # inherited by the spawned workers
+
+        workers = max(1, min(args.workers, args.sessions))
+        shares = [args.sessions // workers + (i < args.sessions % workers) for i in range(workers)]
+        jobs = [(i, n, args.interactions, args.timeout, args.seed) for i, n in enumerate(shares)]
+
+        t0 = time.perf_counter()
+        # One job per fresh process: each worker instruments the loaders once and starts cold
+        with get_context("spawn").Pool(workers, maxtasksperchild=1) as pool:
+            results = pool.map(_run_worker, jobs, chunksize=1)
+        wall_s = time.perf_counter() - t0
+
+    summary = summarize(results)
+    summary["wall_s"] = wall_s
+
+    for k, v in summary.items():
+        print(f"{k:>22}: {v:,.3f}" if isinstance(v, float) else f"{k:>22}: {v}")
+    for err in sorted({e for r in results for e in r["errors"]})[:5]:
+        print(f"  error: {err}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, indent=2))
+
+    failures = check_thresholds(summary, args)
+    for f in failures:
+        print(f"FAIL: {f}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,29 +24,25 @@ def _yoy(series: pd.Series, periods=12):
     return (series.iloc[-1] / series.iloc[-1 - periods] - 1) * 100
 
 
+def _year_span(idx) -> str:
+    # Title text for a pre-windowed frame, e.g. "2020–2024"
+    first, last = idx.min().year, idx.max().year
+    return str(first) if first == last else f"{first}–{last}"
+
+
 def _safe_key(s: str) -> str:
     return "".join(ch if ch.isalnum() or ch in ("_", "-") else "_" for ch in s)
 
 
-def _line_chart(df, title, y_title, cols_to_plot, name_map=None, key="chart"):
+def _line_figure(traces, cols, title, y_title, name_map=None):
+    """Line figure from {col: (x, y)} trace data, one trace per col in `cols`."""
     name_map = name_map or {}
-
-    # only cols
-    cols_ok = []
-    for c in cols_to_plot:
-        if c in df.columns and df[c].dropna().shape[0] > 0:
-            cols_ok.append(c)
-
-    if len(cols_ok) == 0:
-        st.info("No data available for this chart (filters/dataset may not include this country).")
-        return
-
     fig = go.Figure()
-    for c in cols_ok:
-        series = df[c].dropna()
+    for c in cols:
+        x, y = traces[c]
         fig.add_trace(go.Scatter(
-            x=series.index,
-            y=series.values,
+            x=x,
+            y=y,
             mode="lines",
             name=name_map.get(c, c)
         ))
@@ -60,11 +56,69 @@ def _line_chart(df, title, y_title, cols_to_plot, name_map=None, key="chart"):
         legend_title_text=""
     )
     fig.update_xaxes(rangeslider_visible=True)
+    return fig
+
+
+def _line_chart(df, title, y_title, cols_to_plot, name_map=None, key="chart"):
+    # only cols
+    traces = {}
+    for c in cols_to_plot:
+        if c in df.columns and df[c].dropna().shape[0] > 0:
+            series = df[c].dropna()
+            traces[c] = (series.index, series.values)
+
+    if len(traces) == 0:
+        st.info("No data available for this chart (filters/dataset may not include this country).")
+        return
+
+    fig = _line_figure(traces, list(traces), title, y_title, name_map)
 
     #  Unique key 
     st.plotly_chart(fig, use_container_width=True, key=_safe_key(key))
 
 
+def _frame_id(df):
+    # Cheap stand-in for hashing a panel: its columns, shape and date range
+    bounds = (df.index[0], df.index[-1]) if len(df) else ()
+    return tuple(df.columns), df.shape, bounds
+
+
+@st.cache_resource(ttl="6h", max_entries=64)
+def _geo_traces(_df, name, version, frame_id):
+    """Per-geo (x, y) arrays of one indicator panel, prepared once per data version.
+
+    `_df` is not hashed (leading underscore); `name`, `version` and `frame_id`
+    (see _frame_id) identify it, so another geo list gets its own entry.
+    cache_resource so fragment reruns share the arrays instead of unpickling
+    copies — they must not be mutated.
+    """
+    traces = {}
+    for c in _df.columns:
+        series = _df[c].dropna()
+        if not series.empty:
+            traces[c] = (series.index.to_numpy(), series.to_numpy())
+    return traces
+
+
+def _comparison_chart(df, name, title, y_title, selected, name_map, key, version):
+    traces = _geo_traces(df, name, version, _frame_id(df))
+    cols = [c for c in selected if c in traces]
+    if not cols:
+        st.info("No data available for this chart (filters/dataset may not include this country).")
+        return
+
+    # Reuse this session's figure while the geos it actually shows are unchanged,
+    # e.g. adding Norway leaves the interest and debt charts as they were
+    memo_key = f"_fig_{key}"
+    signature = (version, tuple(cols))
+    memo = st.session_state.get(memo_key)
+    if memo is None or memo[0] != signature:
+        memo = (signature, _line_figure(traces, cols, title, y_title, name_map))
+        st.session_state[memo_key] = memo
+
+    st.plotly_chart(memo[1], use_container_width=True, key=_safe_key(key))
+
+
 def big_numbers_block(title, inflation_df, interest_df, unemp_df, pop_df, gdp_df, gdp_pc_df, geo):
     st.subheader(title)
 
@@ -161,10 +215,9 @@ def unemployment_chart(unemp_df, geo, key_prefix=""):
     )
 
 
-def gdp_per_capita_chart(gdp_pc_df, geo, years=15, key_prefix=""):
+def gdp_per_capita_chart(df_recent, geo, key_prefix=""):
+    """df_recent: annual panel already cut to the years to show (see load_aligned)."""
     st.header("GDP per Capita")
-    cutoff = pd.Timestamp.now() - pd.DateOffset(years=years)
-    df_recent = gdp_pc_df[gdp_pc_df.index >= cutoff]
 
     if geo not in df_recent.columns or df_recent[geo].dropna().empty:
         st.info("No GDP per capita data available.")
@@ -180,7 +233,7 @@ def gdp_per_capita_chart(gdp_pc_df, geo, years=15, key_prefix=""):
         name=name_map.get(geo, geo),
     ))
     fig.update_layout(
-        title=f"GDP per capita — last {years} years ({name_map.get(geo, geo)})",
+        title=f"GDP per capita — {_year_span(series.index)} ({name_map.get(geo, geo)})",
         xaxis_title="Year",
         yaxis_title="EUR / person",
         hovermode="x unified",
@@ -189,17 +242,15 @@ def gdp_per_capita_chart(gdp_pc_df, geo, years=15, key_prefix=""):
     st.plotly_chart(fig, use_container_width=True, key=_safe_key(f"{key_prefix}_gdp_pc_{geo}"))
 
 
-def interest_rate_bar_chart(interest_df, geo, years=5, key_prefix=""):
-    st.header("Govt Bond Yield — Last 5 Years")
-    cutoff = pd.Timestamp.now() - pd.DateOffset(years=years)
-    df_recent = interest_df[interest_df.index >= cutoff]
+def interest_rate_bar_chart(yearly_df, geo, key_prefix=""):
+    """yearly_df: yearly average yields, already cut to the years to show (see load_aligned)."""
+    st.header("Govt Bond Yield — Yearly Average")
 
-    if geo not in df_recent.columns or df_recent[geo].dropna().empty:
+    if geo not in yearly_df.columns or yearly_df[geo].dropna().empty:
         st.info("No interest rate data available.")
         return
 
-    # Resample to yearly average for a clean bar chart
-    yearly = df_recent[geo].resample("YE").mean().dropna()
+    yearly = yearly_df[geo].dropna()
     name_map = {"SE": "Sweden", "EU": "Europe", "DK": "Denmark", "FI": "Finland", "NO": "Norway"}
 
     fig = go.Figure()
@@ -211,7 +262,7 @@ def interest_rate_bar_chart(interest_df, geo, years=5, key_prefix=""):
         textposition="outside",
     ))
     fig.update_layout(
-        title=f"Avg govt bond yield — last {years} years ({name_map.get(geo, geo)})",
+        title=f"Avg govt bond yield — {_year_span(yearly.index)} ({name_map.get(geo, geo)})",
         xaxis_title="Year",
         yaxis_title="Yield %",
         hovermode="x unified",
@@ -220,19 +271,18 @@ def interest_rate_bar_chart(interest_df, geo, years=5, key_prefix=""):
     st.plotly_chart(fig, use_container_width=True, key=_safe_key(f"{key_prefix}_int_bar_{geo}"))
 
 
-def interest_detail_chart(detail_df, years=5, key_prefix=""):
-    st.header("Interest Rates Overview — Last 5 Years")
-    cutoff = pd.Timestamp.now() - pd.DateOffset(years=years)
-    df_recent = detail_df[detail_df.index >= cutoff]
+def interest_detail_chart(df_recent, key_prefix=""):
+    """df_recent: monthly rate detail already cut to the period to show (see load_aligned)."""
+    st.header("Interest Rates Overview")
 
-    cols = [c for c in detail_df.columns if c in df_recent.columns and df_recent[c].dropna().shape[0] > 0]
+    cols = [c for c in df_recent.columns if df_recent[c].dropna().shape[0] > 0]
     if not cols:
         st.info("No interest rate detail data available.")
         return
 
     _line_chart(
         df_recent,
-        "Money market & government bond rates",
+        f"Money market & government bond rates — {_year_span(df_recent.index)}",
         "Rate %",
         cols,
         key=f"{key_prefix}_int_detail"
@@ -313,44 +363,51 @@ def unemployment_detail_chart(detail_df, key_prefix=""):
     )
 
 
-def comparison_section(inflation_df, interest_df, unemp_df, pop_df, gdp_pc_df, debt_df, inflation_yoy_df, key_prefix=""):
+@st.fragment
+def comparison_section(inflation_df, interest_df, unemp_df, pop_df, gdp_pc_df, debt_df, inflation_yoy_df, version, key_prefix=""):
+    # A fragment: changing the selection reruns only this section, not the whole script.
+    # `version` (data_version()) keys the cached per-geo traces.
     st.header("Comparison")
 
-    all_opts = ["SE", "EU", "DK", "FI", "NO"]
-    available = [c for c in all_opts if (c in inflation_df.columns or c in interest_df.columns or c in unemp_df.columns)]
+    preferred = ["SE", "EU", "DK", "FI", "NO"]
+    geos = set(inflation_df.columns) | set(interest_df.columns) | set(unemp_df.columns)
+    available = [c for c in preferred if c in geos] + sorted(geos - set(preferred))
 
     selected = st.multiselect(
         "Select countries/regions",
         options=available,
-        default=[c for c in ["SE", "EU", "DK", "FI", "NO"] if c in available],
+        default=[c for c in preferred if c in available],
         key=f"{key_prefix}_cmp_select"
     )
 
     name_map = {"SE": "Sweden", "EU": "Europe", "DK": "Denmark", "FI": "Finland", "NO": "Norway"}
 
+    def chart(df, name, title, y_title):
+        _comparison_chart(df, name, title, y_title, selected, name_map, f"{key_prefix}_cmp_{name}", version)
+
     st.subheader("Inflation Rate (YoY %)")
-    _line_chart(inflation_yoy_df, "Annual inflation rate comparison", "% change", selected, name_map, key=f"{key_prefix}_cmp_infl_yoy")
+    chart(inflation_yoy_df, "infl_yoy", "Annual inflation rate comparison", "% change")
     st.caption("Data available from 1997 (HICP introduced 1996, YoY needs 12 months history).")
 
     st.subheader("Inflation (HICP Index)")
-    _line_chart(inflation_df, "HICP Index comparison", "Index (2015=100)", selected, name_map, key=f"{key_prefix}_cmp_inflation")
+    chart(inflation_df, "inflation", "HICP Index comparison", "Index (2015=100)")
     st.caption("Data available from 1996 (HICP framework introduced in 1996).")
 
     st.subheader("Interest rate")
-    _line_chart(interest_df, "Interest comparison", "Yield %", selected, name_map, key=f"{key_prefix}_cmp_interest")
+    chart(interest_df, "interest", "Interest comparison", "Yield %")
     st.caption("Norway is not available in Eurostat interest rate datasets (not an EU member).")
 
     st.subheader("Unemployment")
-    _line_chart(unemp_df, "Unemployment comparison", "%", selected, name_map, key=f"{key_prefix}_cmp_unemp")
+    chart(unemp_df, "unemp", "Unemployment comparison", "%")
     st.caption("EU data available from 2000 only. Other countries from 1990.")
 
     st.subheader("Population")
-    _line_chart(pop_df, "Population comparison", "Persons", selected, name_map, key=f"{key_prefix}_cmp_pop")
+    chart(pop_df, "pop", "Population comparison", "Persons")
 
     st.subheader("GDP per Capita")
-    _line_chart(gdp_pc_df, "GDP per capita comparison", "EUR / person", selected, name_map, key=f"{key_prefix}_cmp_gdp_pc")
+    chart(gdp_pc_df, "gdp_pc", "GDP per capita comparison", "EUR / person")
     st.caption("EU from 1995, Sweden from 1993. Earlier data not available in Eurostat.")
 
     st.subheader("Government Debt (% of GDP)")
-    _line_chart(debt_df, "Debt-to-GDP comparison", "% of GDP", selected, name_map, key=f"{key_prefix}_cmp_debt")
+    chart(debt_df, "debt", "Debt-to-GDP comparison", "% of GDP")
     st.caption("Norway not available. Denmark from 2000. Sweden/Finland/EU from 1995.")
@@ -0,0 +1,54 @@
+import streamlit as st
+
+from utils.eurostat_loader import ALL_GEOS
+from utils.export import DEFAULT_GEOS, FORMATS, available_indicators, export_payload
+
+
+@st.fragment
+def export_section(key_prefix=""):
+    # A fragment, so changing the export options reruns only this section
+    st.header("Data Export")
+    st.markdown(
+        "Download the processed series behind the charts. Several indicators are combined into one "
+        "long-format file with columns `indicator, geo, series, date, value`. "
+        "The same data is available over HTTP via `python -m utils.export`."
+    )
+
+    indicators = st.multiselect(
+        "Indicators",
+        options=available_indicators(),
+        default=["inflation_yoy", "gdp_per_capita", "debt_to_gdp"],
+        key=f"{key_prefix}_indicators",
+    )
+    geos = st.multiselect(
+        "Countries/regions (Eurostat codes)",
+        options=list(ALL_GEOS),
+        default=list(DEFAULT_GEOS),
+        key=f"{key_prefix}_geos",
+    )
+    c1, c2 = st.columns(2)
+    start_year, end_year = c1.slider("Years", 1990, 2030, (1990, 2030), key=f"{key_prefix}_years")
+    fmt = c2.radio("Format", list(FORMATS), horizontal=True, key=f"{key_prefix}_format")
+
+    if not indicators or not geos:
+        st.info("Select at least one indicator and one country/region.")
+        return
+
+    # Serialise only on request: this section also runs on every rerun of the other tabs
+    if st.button("Prepare export", key=f"{key_prefix}_prepare"):
+        payload = export_payload(
+            indicators,
+            fmt=fmt,
+            geo_list=geos,
+            start=f"{start_year}-01-01",
+            end=f"{end_year}-12-31",
+        )
+        ext, media_type = FORMATS[fmt]
+        st.download_button(
+            f"Download {fmt.upper()} ({len(payload) / 1024:,.0f} KB)",
+            data=payload,
+            file_name=f"eurostat_export.{ext}",
+            mime=media_type,
+            on_click="ignore",
+            key=f"{key_prefix}_download",
+        )
@@ -0,0 +1,16 @@
+import pytest
+import streamlit as st
+
+import utils.eurostat_loader as loader
+from utils.fixtures import write_fixtures
+
+
+@pytest.fixture
+def fixture_cache(tmp_path, monkeypatch):
+    write_fixtures(tmp_path, n_geos=35)  # every geo in ALL_GEOS
+    monkeypatch.setattr(loader, "_CACHE_DIR", tmp_path)
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    yield tmp_path
+    st.cache_data.clear()
+    st.cache_resource.clear()
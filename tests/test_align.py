@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+import streamlit as st
+
+import utils.eurostat_loader as loader
+from utils.fixtures import synthetic_dataset
+
+
+@pytest.fixture
+def monthly(fixture_cache):
+    return loader.load_interest_rates()
+
+
+@pytest.fixture
+def annual(fixture_cache):
+    return loader.load_gdp()
+
+
+def _by_period(df, period, how):
+    grouped = df.groupby(df.index.to_period(period))
+    out = grouped.sum(min_count=1) if how == "sum" else getattr(grouped, how)()
+    out.index = out.index.to_timestamp()
+    return out
+
+
+@pytest.mark.parametrize("how", loader.AGGREGATIONS)
+@pytest.mark.parametrize("freq, period", [("A", "Y"), ("Q", "Q")])
+def test_monthly_to_coarser_aggregates(monthly, how, freq, period):
+    out = loader._align(monthly, freq, how)
+    pd.testing.assert_frame_equal(out, _by_period(monthly, period, how), check_freq=False, check_names=False)
+
+
+@pytest.mark.parametrize("how", loader.AGGREGATIONS)
+def test_same_frequency_is_unchanged(monthly, how):
+    out = loader._align(monthly, "M", how)
+    pd.testing.assert_frame_equal(out, monthly, check_freq=False, check_names=False)
+
+
+@pytest.mark.parametrize("how, divisor", [("mean", 1), ("last", 1), ("sum", 12)])
+def test_annual_to_monthly_repeats_values(annual, how, divisor):
+    out = loader._align(annual, "M", how)
+
+    assert len(out) == 12 * len(annual)
+    assert out.index[-1] == annual.index[-1] + pd.DateOffset(months=11)
+    expected = annual.reindex(out.index.to_period("Y").to_timestamp()).to_numpy() / divisor
+    np.testing.assert_allclose(out.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("how, divisor", [("mean", 1), ("last", 1), ("sum", 4)])
+def test_annual_to_quarterly_repeats_values(annual, how, divisor):
+    out = loader._align(annual, "Q", how)
+
+    assert len(out) == 4 * len(annual)
+    np.testing.assert_allclose(out.iloc[::4].to_numpy(), annual.to_numpy() / divisor)
+    np.testing.assert_allclose(out.iloc[3::4].to_numpy(), annual.to_numpy() / divisor)
+
+
+def test_upsampling_does_not_bridge_gaps(annual):
+    gappy = annual.copy()
+    gappy.loc[gappy.index[5], "SE"] = np.nan
+    out = loader._align(gappy, "M", "mean")
+
+    missing_year = out.index.year == gappy.index[5].year
+    assert out.loc[missing_year, "SE"].isna().all()
+    assert out.loc[missing_year, "DK"].notna().all()
+
+
+@pytest.mark.parametrize("how", loader.AGGREGATIONS)
+@pytest.mark.parametrize("freq", loader.FREQUENCIES)
+def test_single_monthly_row(monthly, how, freq):
+    one = monthly.iloc[-1:]  # 2024-12: too short to infer a frequency
+    out = loader._align(one, freq, how)
+
+    assert len(out) == 1
+    np.testing.assert_allclose(out.to_numpy(), one.to_numpy())
+
+
+def test_rejects_unknown_frequency_and_aggregation(monthly):
+    with pytest.raises(ValueError):
+        loader._align(monthly, "W", "mean")
+    with pytest.raises(ValueError):
+        loader._align(monthly, "A", "median")
+
+
+def test_gdp_per_capita_matches_index_intersection(fixture_cache):
+    # GDP over a shorter span than population, so the intersection matters
+    synthetic_dataset("nama_10_gdp", n_years=20).to_parquet(fixture_cache / "nama_10_gdp.parquet", index=False)
+    st.cache_data.clear()
+
+    gdp = loader.load_gdp()
+    pop = loader.load_population()
+    common_idx = gdp.index.intersection(pop.index)
+    expected = ((gdp.loc[common_idx] * 1_000_000) / pop.loc[common_idx]).round(0).dropna(axis=1, how="all")
+
+    out = loader.load_gdp_per_capita()
+    assert len(out) == 20
+    pd.testing.assert_frame_equal(out, expected, check_freq=False, check_names=False)
+
+
+def test_load_aligned_window_leaves_shared_panels_untouched(fixture_cache):
+    panels = loader._aligned_panels(loader.data_version(), "mean")
+    keys = set(panels)
+
+    recent = loader.load_aligned("interest_rates", "A", years=5)
+
+    assert set(panels) == keys
+    assert (recent.index >= pd.Timestamp.now() - pd.DateOffset(years=5)).all()
@@ -0,0 +1,112 @@
+import io
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import utils.export as export
+
+
+@pytest.fixture
+def server(fixture_cache):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), export.ExportHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read()
+
+
+def _read(payload, fmt):
+    if fmt == "csv":
+        return pd.read_csv(io.BytesIO(payload), parse_dates=["date"])
+    if fmt == "parquet":
+        return pd.read_parquet(io.BytesIO(payload))
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
+
+def test_export_frame_columns_and_geo_names(fixture_cache):
+    out = export.export_frame(["inflation_yoy", "unemployment_detail"], geo_list=("SE", "EU27_2020"))
+
+    assert list(out.columns) == ["indicator", "geo", "series", "date", "value"]
+    assert set(out["indicator"]) == {"inflation_yoy", "unemployment_detail"}
+    assert set(out["geo"]) == {"SE", "EU"}
+    assert out.loc[out["indicator"] == "inflation_yoy", "series"].isna().all()
+    assert out.loc[out["indicator"] == "unemployment_detail", "series"].notna().all()
+    assert out["value"].notna().all()
+
+
+def test_export_frame_selects_from_shared_panel(fixture_cache):
+    out = export.export_frame(["debt_to_gdp"], geo_list=("DK",))
+    panel = export.PANEL_LOADERS["debt_to_gdp"](geo_list=export.ALL_GEOS)
+
+    expected = panel["DK"].dropna()
+    assert set(out["geo"]) == {"DK"}
+    assert out["value"].tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("fmt", list(export.FORMATS))
+def test_payload_round_trips(fixture_cache, fmt):
+    frame = export.export_frame(["gdp_per_capita", "interest_rates_detail"], geo_list=("FI", "SE"))
+    payload = export.export_payload(["interest_rates_detail", "gdp_per_capita"], fmt=fmt, geo_list=("SE", "FI"))
+
+    def _normalized(df):
+        # Panel rows have no series; formats differ in how they spell "missing"
+        df = df.assign(series=df["series"].fillna("").astype(str), date=pd.to_datetime(df["date"]))
+        return df.sort_values(["indicator", "geo", "series", "date"]).reset_index(drop=True)
+
+    back = _read(payload, fmt)
+    pd.testing.assert_frame_equal(_normalized(back), _normalized(frame), check_dtype=False)
+
+
+def test_start_end_clipping(fixture_cache):
+    out = export.export_frame(["inflation", "unemployment_detail"], geo_list=("SE",), start="2010-01-01", end="2012-06-30")
+
+    assert out["date"].min() == pd.Timestamp("2010-01-01")
+    assert out["date"].max() == pd.Timestamp("2012-06-01")
+
+
+def test_rejects_unknown_geo(fixture_cache):
+    with pytest.raises(ValueError):
+        export.export_payload(["inflation"], geo_list=("SE", "ZZ1"))
+    with pytest.raises(ValueError):
+        export.export_frame(["inflation"], geo_list=())
+
+
+def test_handler_serves_export(server):
+    status, body = _get(f"{server}/export?indicators=inflation_yoy&geo=SE,EU27_2020&start=2020-01-01")
+
+    assert status == 200
+    assert set(pd.read_csv(io.BytesIO(body))["geo"]) == {"SE", "EU"}
+
+
+@pytest.mark.parametrize("query", [
+    "indicators=inflation&format=xlsx",
+    "indicators=inflation&start=not-a-date",
+    "indicators=inflation&geo=SE,ZZ1",
+    "indicators=nope",
+])
+def test_handler_bad_request(server, query):
+    status, _ = _get(f"{server}/export?{query}")
+    assert status == 400
+
+
+def test_handler_internal_error(server, monkeypatch):
+    def _fail(*args, **kwargs):
+        raise OSError("Eurostat unavailable")
+
+    monkeypatch.setattr(export, "export_payload", _fail)
+    status, _ = _get(f"{server}/export?indicators=inflation")
+    assert status == 500
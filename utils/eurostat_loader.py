@@ -1,15 +1,24 @@
 import pandas as pd
-import eurostat
 import streamlit as st
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 import time as _time
+import hashlib
+import os
+import threading
 
 # --- Local file cache ---
-_CACHE_DIR = Path(__file__).resolve().parent.parent / ".data_cache"
+# EUROSTAT_CACHE_DIR points the app at another cache, e.g. synthetic fixtures (see loadtest.py)
+_CACHE_DIR = Path(os.environ.get("EUROSTAT_CACHE_DIR") or Path(__file__).resolve().parent.parent / ".data_cache")
 _CACHE_MAX_AGE_HOURS = 6
 _START_YEAR = "1990"
 
+# Default regions first, then the remaining EU member states (Eurostat geo codes)
+ALL_GEOS = ("SE", "EU27_2020", "DK", "FI", "NO") + (
+    "AT", "BE", "BG", "CY", "CZ", "DE", "EE", "EL", "ES", "FR", "HR", "HU", "IE",
+    "IT", "LT", "LU", "LV", "MT", "NL", "PL", "PT", "RO", "SI", "SK",
+)
+
 # All Eurostat dataset codes used by this app
 _ALL_DATASETS = ("prc_hicp_midx", "une_rt_m", "demo_pjan", "nama_10_gdp", "irt_lt_mcby_m", "gov_10dd_edpt1", "irt_st_m")
 
@@ -30,8 +39,10 @@ def _fetch_and_cache(dataset_code: str) -> pd.DataFrame:
     path = _cache_path(dataset_code)
     if _is_cache_fresh(path):
         return pd.read_parquet(path)
+    import eurostat  # deferred: only needed on a refresh, keeps cached startups off the fetch stack
+
     df = eurostat.get_data_df(dataset_code)
-    _CACHE_DIR.mkdir(exist_ok=True)
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
     df.to_parquet(path, index=False)
     return df
 
@@ -45,6 +56,33 @@ def prefetch_all():
         list(pool.map(_fetch_and_cache, stale))
 
 
+_seen_version = None
+_version_lock = threading.Lock()
+
+
+def data_version() -> str:
+    """Token that changes whenever any cached dataset file is rewritten.
+
+    The loaders' st.cache_data entries are not keyed by it, so they are cleared
+    here when the token changes; anything cached per version (export payloads,
+    aligned panels, comparison traces) is then rebuilt from fresh panels.
+    Call it after prefetch_all() and before reading any loader.
+    """
+    global _seen_version
+    parts = []
+    for d in _ALL_DATASETS:
+        path = _cache_path(d)
+        parts.append(f"{d}:{path.stat().st_mtime_ns if path.exists() else 0}")
+    version = hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+    with _version_lock:
+        if _seen_version is not None and version != _seen_version:
+            for load in list(PANEL_LOADERS.values()) + list(DETAIL_LOADERS.values()):
+                load.clear()
+        _seen_version = version
+    return version
+
+
 def _get_dataset(dataset_code: str) -> pd.DataFrame:
     """Read from local cache (fast) or fetch if stale."""
     path = _cache_path(dataset_code)
@@ -87,6 +125,48 @@ def _clip_dates(df: pd.DataFrame) -> pd.DataFrame:
     return df[df.index >= "1990-01-01"]
 
 
+# --- Frequency alignment ---
+
+# Target frequency -> period-start resample rule (same labels as the loaders' index)
+_FREQ_RULES = {"M": "MS", "Q": "QS", "A": "YS"}
+_FREQ_MONTHS = {"M": 1, "Q": 3, "A": 12}
+AGGREGATIONS = ("mean", "last", "sum")
+
+
+def _native_freq(idx):
+    # None when there are too few rows to tell; _align then treats the target as coarser
+    if len(idx) < 2:
+        return None
+    days = pd.Series(idx).diff().dt.days.median()
+    return "M" if days < 45 else "Q" if days < 120 else "A"
+
+
+def _align(df: pd.DataFrame, freq: str, how: str = "mean") -> pd.DataFrame:
+    """Resample a date-indexed panel to M/Q/A.
+
+    Coarser targets aggregate with `how`; finer targets repeat each value over its
+    sub-periods (sums are spread evenly instead).
+    """
+    if freq not in _FREQ_RULES:
+        raise ValueError(f"Unknown frequency '{freq}' (expected one of: {', '.join(_FREQ_RULES)})")
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation '{how}' (expected one of: {', '.join(AGGREGATIONS)})")
+    if df.empty:
+        return df
+
+    native = _native_freq(df.index)
+    if native is None or _FREQ_MONTHS[freq] >= _FREQ_MONTHS[native]:
+        resampled = df.resample(_FREQ_RULES[freq])
+        out = resampled.sum(min_count=1) if how == "sum" else getattr(resampled, how)()
+    else:
+        step = _FREQ_MONTHS[native] // _FREQ_MONTHS[freq]
+        end = df.index[-1] + pd.DateOffset(months=_FREQ_MONTHS[native] - _FREQ_MONTHS[freq])
+        out = df.reindex(pd.date_range(df.index[0], end, freq=_FREQ_RULES[freq])).ffill(limit=step - 1)
+        if how == "sum":
+            out = out / step
+    return out.dropna(how="all")
+
+
 def _load_wide(dataset_code: str, geo_list, filters: dict, rename_geo=None):
     df = _get_dataset(dataset_code).copy()
 
@@ -120,6 +200,7 @@ def _load_wide(dataset_code: str, geo_list, filters: dict, rename_geo=None):
 
 # --- Public loaders ---
 
+
 @st.cache_data(ttl="6h")
 def load_inflation(geo_list=("SE", "EU27_2020", "DK", "FI", "NO")):
     # Include "EU" geo code which has data from 1996 (EU27_2020 only from 2000)
@@ -164,12 +245,9 @@ def load_gdp(geo_list=("SE", "EU27_2020", "DK", "FI", "NO")):
 
 @st.cache_data(ttl="6h")
 def load_gdp_per_capita(geo_list=("SE", "EU27_2020", "DK", "FI", "NO")):
-    gdp = load_gdp(geo_list=geo_list)
-    pop = load_population(geo_list=geo_list)
-
-    common_idx = gdp.index.intersection(pop.index)
-    gdp = gdp.loc[common_idx]
-    pop = pop.loc[common_idx]
+    gdp = _align(load_gdp(geo_list=geo_list), "A")
+    pop = _align(load_population(geo_list=geo_list), "A")
+    gdp, pop = gdp.align(pop, join="inner", axis=0)
 
     gdp_pc = (gdp * 1_000_000) / pop
     gdp_pc = gdp_pc.round(0)
@@ -281,3 +359,75 @@ def load_interest_rates_detail(geo="SE"):
     out.index = _to_datetime_index(out.index)
     out = out.sort_index()
     return _clip_dates(out.dropna(how="all"))
+
+
+# Geo-keyed panels (index = date, cols = geo), by export/indicator name
+PANEL_LOADERS = {
+    "inflation": load_inflation,
+    "inflation_yoy": load_inflation_yoy,
+    "interest_rates": load_interest_rates,
+    "unemployment": load_unemployment,
+    "population": load_population,
+    "gdp": load_gdp,
+    "gdp_per_capita": load_gdp_per_capita,
+    "debt_to_gdp": load_debt_to_gdp,
+}
+
+# Single-geo breakdowns (index = date, cols = series label)
+DETAIL_LOADERS = {
+    "unemployment_detail": load_unemployment_detail,
+    "interest_rates_detail": load_interest_rates_detail,
+}
+
+
+# --- Aligned panels ---
+
+FREQUENCIES = tuple(_FREQ_RULES)
+
+
+def _aligned_sources():
+    # Same ALL_GEOS loader entries app.py reads, so each dataset is transformed once.
+    # Detail breakdowns are aligned for Sweden, the only country the app details
+    sources = {name: (lambda fn=fn: fn(geo_list=ALL_GEOS)) for name, fn in PANEL_LOADERS.items()}
+    for name, fn in DETAIL_LOADERS.items():
+        sources[name] = lambda fn=fn: fn(geo="SE")
+    return sources
+
+
+@st.cache_resource(ttl="6h", max_entries=len(AGGREGATIONS) * 2)
+def _aligned_panels(version: str, how: str) -> dict:
+    """Every indicator at every frequency, built once per data version.
+
+    cache_resource (not cache_data) so readers share the frames instead of
+    unpickling copies on each rerun — nobody may mutate the dict or its frames.
+    """
+    panels = {}
+    for name, load in _aligned_sources().items():
+        df = load()
+        for freq in FREQUENCIES:
+            panels[(name, freq)] = _align(df, freq, how)
+    return panels
+
+
+@st.cache_resource(ttl="1h", max_entries=64)
+def _aligned_window(version: str, how: str, indicator: str, freq: str, years: int) -> pd.DataFrame:
+    # Shorter ttl than the panels so the "last N years" cutoff follows the clock
+    df = _aligned_panels(version, how)[(indicator, freq)]
+    cutoff = pd.Timestamp.now() - pd.DateOffset(years=years)
+    return df[df.index >= cutoff]
+
+
+def load_aligned(indicator: str, freq: str = "A", how: str = "mean", years=None) -> pd.DataFrame:
+    """Indicator panel at frequency M/Q/A, optionally only the last `years` years.
+
+    Read-only: the frame is shared between sessions.
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation '{how}' (expected one of: {', '.join(AGGREGATIONS)})")
+    version = data_version()
+    panels = _aligned_panels(version, how)
+    if (indicator, freq) not in panels:
+        raise ValueError(f"No aligned panel for indicator '{indicator}' at frequency '{freq}'")
+    if years is None:
+        return panels[(indicator, freq)]
+    return _aligned_window(version, how, indicator, freq, years)
@@ -0,0 +1,200 @@
+"""Batch export of the processed loader panels as Arrow IPC, Parquet or CSV.
+
+Serves the Streamlit download buttons and a small local HTTP endpoint:
+
+    python -m utils.export --port 8765
+    curl "http://127.0.0.1:8765/export?indicators=inflation_yoy,debt_to_gdp&geo=SE,DK&start=2000-01&format=parquet"
+"""
+import argparse
+import io
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import streamlit as st
+
+from utils.eurostat_loader import ALL_GEOS, DETAIL_LOADERS, PANEL_LOADERS, data_version
+
+DEFAULT_GEOS = ("SE", "EU27_2020", "DK", "FI", "NO")
+
+# format -> (file extension, media type)
+FORMATS = {
+    "arrow": ("arrow", "application/vnd.apache.arrow.stream"),
+    "parquet": ("parquet", "application/vnd.apache.parquet"),
+    "csv": ("csv", "text/csv"),
+}
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def available_indicators():
+    return list(PANEL_LOADERS) + list(DETAIL_LOADERS)
+
+
+def _output_geo(geo: str) -> str:
+    # Loaders rename the EU27 aggregate to "EU"
+    return "EU" if geo == "EU27_2020" else geo
+
+
+def _check_geos(geo_list) -> tuple:
+    geo_list = tuple(geo_list)
+    if not geo_list:
+        raise ValueError("No countries/regions requested")
+    unknown = [g for g in geo_list if g not in ALL_GEOS]
+    if unknown:
+        raise ValueError(f"Unknown geo code(s): {', '.join(unknown)} (expected EU members, EU27_2020 or NO)")
+    return geo_list
+
+
+def _clip_range(df: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+    if start:
+        df = df[df.index >= pd.Timestamp(start)]
+    if end:
+        df = df[df.index <= pd.Timestamp(end)]
+    return df
+
+
+def _melt(df: pd.DataFrame, var_name: str) -> pd.DataFrame:
+    long = df.rename_axis("date").reset_index().melt(id_vars="date", var_name=var_name, value_name="value")
+    return long.dropna(subset=["value"])
+
+
+def export_frame(indicators, geo_list=DEFAULT_GEOS, start=None, end=None) -> pd.DataFrame:
+    """Long-format frame (indicator, geo, series, date, value) for several indicators.
+
+    Reads the st.cache_data'd loader outputs — the same ALL_GEOS panels app.py
+    loads — and selects the requested columns; nothing is re-transformed here.
+    Geo codes outside ALL_GEOS are rejected, so requests cannot grow the loader caches.
+    """
+    unknown = [i for i in indicators if i not in PANEL_LOADERS and i not in DETAIL_LOADERS]
+    if unknown:
+        raise ValueError(f"Unknown indicator(s): {', '.join(unknown)}")
+
+    geo_list = _check_geos(geo_list)
+    out_geos = {_output_geo(g) for g in geo_list}
+
+    frames = []
+    for name in indicators:
+        if name in PANEL_LOADERS:
+            panel = PANEL_LOADERS[name](geo_list=ALL_GEOS)
+            panel = _clip_range(panel[[c for c in panel.columns if c in out_geos]], start, end)
+            long = _melt(panel, "geo")
+            long["series"] = None
+        else:
+            parts = []
+            for geo in geo_list:
+                detail = _clip_range(DETAIL_LOADERS[name](geo=geo), start, end)
+                part = _melt(detail, "series")
+                part["geo"] = _output_geo(geo)
+                parts.append(part)
+            long = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=["date", "series", "value", "geo"])
+        long["indicator"] = name
+        frames.append(long)
+
+    out = pd.concat(frames, ignore_index=True)
+    return out[["indicator", "geo", "series", "date", "value"]]
+
+
+def _serialize(df: pd.DataFrame, fmt: str) -> bytes:
+    if fmt == "csv":
+        return df.to_csv(index=False).encode("utf-8")
+    if fmt == "parquet":
+        buf = io.BytesIO()
+        df.to_parquet(buf, index=False)
+        return buf.getvalue()
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+@st.cache_data(ttl="6h", max_entries=64)
+def _serialized_payload(indicators, fmt, geo_list, start, end, version):
+    # `version` is only part of the cache key: a refreshed dataset invalidates old payloads
+    return _serialize(export_frame(indicators, geo_list, start, end), fmt)
+
+
+def export_payload(indicators, fmt="csv", geo_list=DEFAULT_GEOS, start=None, end=None) -> bytes:
+    """Serialized export, cached per request shape and data version."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (expected one of: {', '.join(FORMATS)})")
+    if not indicators:
+        raise ValueError("No indicators requested")
+    # Sorted + deduplicated so the same request in another order shares cache entries
+    indicators = tuple(sorted(set(indicators)))
+    geo_list = tuple(sorted(set(_check_geos(geo_list))))
+    return _serialized_payload(indicators, fmt, geo_list, start or None, end or None, data_version())
+
+
+# --- Local HTTP endpoint ---
+
+class ExportHandler(BaseHTTPRequestHandler):
+    def _send(self, status, body: bytes, content_type="text/plain; charset=utf-8", filename=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if filename:
+            self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.end_headers()
+        view = memoryview(body)
+        for i in range(0, len(view), _CHUNK_SIZE):
+            self.wfile.write(view[i:i + _CHUNK_SIZE])
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/indicators":
+            self._send(200, "\n".join(available_indicators()).encode("utf-8") + b"\n")
+            return
+        if url.path != "/export":
+            self._send(404, b"Not found. Use /export or /indicators\n")
+            return
+
+        qs = parse_qs(url.query)
+
+        def _param(name, default=None):
+            return qs[name][0] if name in qs else default
+
+        def _list(name, default=()):
+            return [v for item in qs.get(name, []) for v in item.split(",") if v] or list(default)
+
+        fmt = _param("format", "csv")
+        try:
+            body = export_payload(
+                _list("indicators"),
+                fmt=fmt,
+                geo_list=_list("geo", DEFAULT_GEOS),
+                start=_param("start"),
+                end=_param("end"),
+            )
+        except ValueError as exc:
+            self._send(400, f"{exc}\n".encode("utf-8"))
+            return
+        except Exception as exc:  # e.g. a failed Eurostat refresh
+            self.log_error("export failed: %r", exc)
+            self._send(500, b"Export failed\n")
+            return
+
+        ext, media_type = FORMATS[fmt]
+        self._send(200, body, content_type=media_type, filename=f"eurostat_export.{ext}")
+
+
+def serve(host="127.0.0.1", port=8765):
+    server = ThreadingHTTPServer((host, port), ExportHandler)
+    print(f"Serving exports on http://{host}:{port}/export")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve processed Eurostat panels over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    serve(args.host, args.port)
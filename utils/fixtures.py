@@ -0,0 +1,105 @@
+"""Synthetic Eurostat-shaped datasets for offline load tests and benchmarks.
+
+Frames mimic eurostat.get_data_df(): dimension columns, then "geo\\TIME_PERIOD",
+then one column per period ("YYYY" for annual, "YYYY-MM" for monthly data).
+Output is deterministic for a given seed and scales by geos, dimensions and periods.
+"""
+import zlib
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FIXTURE_GEOS = ("SE", "DK", "FI", "NO", "EU27_2020", "EU", "EA", "EA20")
+# Used (in order) when more geos are requested than FIXTURE_GEOS holds
+_EXTRA_GEOS = (
+    "AT", "BE", "BG", "CY", "CZ", "DE", "EE", "EL", "ES", "FR", "HR", "HU", "IE", "IT",
+    "LT", "LU", "LV", "MT", "NL", "PL", "PT", "RO", "SI", "SK", "IS", "CH", "LI",
+)
+_LAST_YEAR = 2024
+
+# dataset -> (frequency, first year, dimensions in Eurostat column order, base level)
+DATASET_SPECS = {
+    "prc_hicp_midx": ("M", 1996, {"freq": ["M"], "unit": ["I15", "I05"], "coicop": ["CP00", "CP01"]}, 100.0),
+    "une_rt_m": ("M", 1990, {
+        "freq": ["M"],
+        "s_adj": ["SA", "NSA"],
+        "age": ["TOTAL", "Y_LT25", "Y25-74"],
+        "unit": ["PC_ACT", "THS_PER"],
+        "sex": ["T", "M", "F"],
+    }, 7.0),
+    "demo_pjan": ("A", 1990, {"freq": ["A"], "unit": ["NR"], "age": ["TOTAL", "Y_LT5"], "sex": ["T", "M", "F"]}, 5_000_000.0),
+    "nama_10_gdp": ("A", 1990, {"freq": ["A"], "unit": ["CP_MEUR", "CLV10_MEUR"], "na_item": ["B1GQ", "P3"]}, 300_000.0),
+    "irt_lt_mcby_m": ("M", 1990, {"freq": ["M"], "int_rt": ["MCBY"]}, 3.0),
+    "gov_10dd_edpt1": ("A", 1995, {"freq": ["A"], "unit": ["PC_GDP", "MIO_EUR"], "sector": ["S13", "S1311"], "na_item": ["GD", "B9"]}, 45.0),
+    "irt_st_m": ("M", 1990, {"freq": ["M"], "int_rt": ["IRT_DTD", "IRT_M1", "IRT_M3", "IRT_M6", "IRT_M12"]}, 2.0),
+}
+
+
+def _periods(freq: str, first_year: int, last_year: int = _LAST_YEAR):
+    if freq == "A":
+        return [str(y) for y in range(first_year, last_year + 1)]
+    return [f"{y}-{m:02d}" for y in range(first_year, last_year + 1) for m in range(1, 13)]
+
+
+def _geos(n_geos=None):
+    if n_geos is None:
+        return list(FIXTURE_GEOS)
+    pool = list(FIXTURE_GEOS) + list(_EXTRA_GEOS)
+    pool += [f"G{i:03d}" for i in range(max(0, n_geos - len(pool)))]
+    return pool[:n_geos]
+
+
+def make_wide_frame(dims: dict, geos, periods, base=100.0, seed=0) -> pd.DataFrame:
+    """Eurostat-shaped wide frame: one row per (dims..., geo), one column per period.
+
+    Values are a geometric random walk around `base`, so indices, rates and
+    levels all stay positive and plausibly smooth.
+    """
+    rng = np.random.default_rng(seed)
+    keys = list(product(*dims.values(), geos))
+
+    walk = np.cumsum(rng.normal(0.0, 0.01, size=(len(keys), len(periods))), axis=1)
+    values = (base * np.exp(walk)).round(2)
+
+    df = pd.DataFrame(keys, columns=list(dims) + ["geo\\TIME_PERIOD"])
+    return pd.concat([df, pd.DataFrame(values, columns=list(periods))], axis=1)
+
+
+def synthetic_dataset(dataset_code: str, seed: int = 0, n_geos=None, n_years=None, extra_dims=0) -> pd.DataFrame:
+    """Deterministic wide frame for one of the app's Eurostat datasets.
+
+    n_geos / n_years override the default geo list and period span (12 period
+    columns per year for monthly datasets, one for annual ones); extra_dims
+    adds filler dimension columns (two values each) that multiply the row count.
+    The codes the loaders filter on are always present.
+    """
+    freq, first_year, dims, base = DATASET_SPECS[dataset_code]
+    if n_years is not None:
+        first_year = _LAST_YEAR - n_years + 1
+    dims = dict(dims)
+    for i in range(extra_dims):
+        dims[f"dim{i}"] = ["A", "B"]
+    return make_wide_frame(
+        dims,
+        _geos(n_geos),
+        _periods(freq, first_year),
+        base=base,
+        seed=[seed, zlib.crc32(dataset_code.encode())],
+    )
+
+
+def write_fixtures(cache_dir, seed: int = 0, **scale):
+    """Write every dataset as parquet, laid out like the loader's .data_cache/.
+
+    Keyword arguments (n_geos, n_years, extra_dims) are passed to synthetic_dataset.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for code in DATASET_SPECS:
+        path = cache_dir / f"{code}.parquet"
+        synthetic_dataset(code, seed=seed, **scale).to_parquet(path, index=False)
+        paths.append(path)
+    return paths
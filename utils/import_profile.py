@@ -0,0 +1,95 @@
+"""Import-time profile of the dashboard's cold start.
+
+    python -m utils.import_profile                 # app modules + heavy deps
+    python -m utils.import_profile --top 30 plotly.graph_objects
+
+Each module is imported in a fresh interpreter with `python -X importtime`, so the
+numbers match a cold container start rather than a warm rerun. Besides the
+standalone cost, each module is timed after `import streamlit`: the server has
+imported Streamlit (and with it pandas and plotly) before app.py runs, so that
+is the cost the app actually adds.
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+# What app.py imports on a cached startup, followed by what it defers
+DEFAULT_MODULES = (
+    "streamlit",
+    "pandas",
+    "plotly.graph_objects",
+    "utils.eurostat_loader",
+    "modules.charts",
+    "modules.export",
+    "eurostat",
+)
+
+BASELINE = "streamlit"
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(module: str, after=None):
+    """Return (total_us, [(cumulative_us, self_us, name), ...]) for importing `module` cold.
+
+    With `after`, that module is imported first and only what `module` adds on
+    top of it is counted. Rows are limited to the subtree of `module`'s own
+    top-level imports, so interpreter-startup modules are never listed.
+    """
+    statement = f"import {after}; import {module}" if after else f"import {module}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise ImportError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else module)
+
+    # `import a.b.c` shows up as top-level imports of a, a.b and a.b.c
+    targets = {".".join(module.split(".")[:i]) for i in range(1, module.count(".") + 2)}
+
+    # -X importtime prints a module once its import finishes, so the nested rows of a
+    # top-level (depth 0) entry are the ones printed since the previous top-level entry
+    rows = []
+    pending = []
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        row = (int(cum_us), int(self_us), name.strip())
+        pending.append(row)
+        if len(name) - len(name.lstrip()) > 1:  # nested
+            continue
+        if row[2] in targets:
+            rows += pending
+            total += row[0]
+        pending = []
+    return total, rows
+
+
+def report(modules=DEFAULT_MODULES, top=10):
+    lines = [f"{'module':<28} {'cold import':>12} {'after ' + BASELINE:>18}"]
+    details = []
+    for module in modules:
+        try:
+            total, rows = import_times(module)
+            extra = "" if module == BASELINE else f"{import_times(module, after=BASELINE)[0] / 1000:15.1f} ms"
+        except ImportError as exc:
+            lines.append(f"{module:<28} {'n/a':>12}  ({exc})")
+            continue
+        lines.append(f"{module:<28} {total / 1000:9.1f} ms {extra}")
+        heaviest = sorted(rows, reverse=True)[:top]
+        details.append(f"\n{module} — slowest {len(heaviest)} imports (cumulative / self):")
+        details += [f"  {cum / 1000:8.1f} ms {self_us / 1000:8.1f} ms  {name}" for cum, self_us, name in heaviest]
+    return "\n".join(lines + details)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile cold import time of the dashboard's modules.")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--top", type=int, default=10, help="slowest nested imports to list per module")
+    args = parser.parse_args()
+    print(report(args.modules, top=args.top))